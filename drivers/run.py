@@ -16,8 +16,14 @@
 
 from __future__ import annotations
 import click
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
+import platform
 from typing import TYPE_CHECKING
 
+from gt4py.cartesian import config as gt_config
+
 from cloudsc_gt4py.physics.cloudsc import Cloudsc
 from cloudsc_gt4py.physics.cloudsc_split import CloudscSplit
 from cloudsc_gt4py.initialization.reference import (
@@ -36,16 +42,72 @@ from ifs_physics_common.utils.timing import timing
 from ifs_physics_common.utils.validation import validate
 
 if TYPE_CHECKING:
-    from typing import Literal, Optional, Type
+    from typing import Literal, Optional, Tuple, Type
 
     from ifs_physics_common.framework.config import IOConfig, PythonConfig
+    from ifs_physics_common.utils.typingx import DataArrayDict
 
     from .config import DEFAULT_CONFIG, DEFAULT_IO_CONFIG
 else:
     from config import DEFAULT_CONFIG, DEFAULT_IO_CONFIG
 
 
-def core(config: PythonConfig, io_config: IOConfig, cloudsc_cls: Type) -> None:
+def get_host_tag() -> str:
+    cpu = platform.processor()
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpu = next(
+                (line.split(":", 1)[1].strip() for line in f if line.startswith("model name")),
+                cpu,
+            )
+    except OSError:
+        pass
+    cpu_hash = hashlib.sha1((cpu or platform.node()).encode()).hexdigest()[:8]
+    return f"{platform.machine()}_{cpu_hash}"
+
+
+def enable_persistent_cache() -> None:
+    # gt4py fingerprints each stencil by definition, externals, dtypes and backend:
+    # a fixed cache location lets any later invocation reuse the compiled stencils
+    if "GT_CACHE_ROOT" not in os.environ:
+        cache_root = os.path.join(
+            os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "cloudsc_gt4py"
+        )
+        os.makedirs(cache_root, exist_ok=True)
+        gt_config.cache_settings["root_path"] = cache_root
+
+
+def enable_fast_math(backend: str) -> None:
+    # the flags are passed to the compiler by all compiled backends, gt and dace alike
+    extra_compile_args = gt_config.build_settings["extra_compile_args"]
+    extra_compile_args["cxx"] = [*extra_compile_args["cxx"], "-march=native", "-ffast-math"]
+    extra_compile_args["cuda"] = [*extra_compile_args["cuda"], "--use_fast_math"]
+    if backend != "numpy":
+        # the flags do not enter the stencil fingerprint, so keep the resulting builds in a
+        # separate cache, specific to the processor they target
+        gt_config.cache_settings["dir_name"] += f"_{get_host_tag()}_fast_math"
+
+
+def get_reference(
+    computational_grid: ComputationalGrid, config: PythonConfig
+) -> Tuple[DataArrayDict, DataArrayDict]:
+    hdf5_reader = HDF5Reader(config.reference_file, config.data_types)
+    tends = get_reference_tendencies(
+        computational_grid, hdf5_reader, gt4py_config=config.gt4py_config
+    )
+    diags = get_reference_diagnostics(
+        computational_grid, hdf5_reader, gt4py_config=config.gt4py_config
+    )
+    return tends, diags
+
+
+def core(
+    config: PythonConfig,
+    io_config: IOConfig,
+    cloudsc_cls: Type,
+    *,
+    collect_exec_info: bool = False,
+) -> None:
     hdf5_reader = HDF5Reader(config.input_file, config.data_types)
 
     nx = config.num_cols or hdf5_reader.get_nlon()
@@ -60,18 +122,28 @@ def core(config: PythonConfig, io_config: IOConfig, cloudsc_cls: Type) -> None:
     yomcst_parameters = hdf5_reader.get_yomcst_parameters()
     yrecldp_parameters = hdf5_reader.get_yrecldp_parameters()
 
-    cloudsc = cloudsc_cls(
-        computational_grid,
-        yoecldp_paramaters,
-        yoethf_parameters,
-        yomcst_parameters,
-        yrecldp_parameters,
-        enable_checks=config.sympl_enable_checks,
-        gt4py_config=config.gt4py_config,
-    )
-    tends, diags = cloudsc(state, dt)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # read the reference data while the stencils get compiled; the executor waits for the
+        # reads to complete before the timed runs start
+        future_ref = (
+            executor.submit(get_reference, computational_grid, config)
+            if config.enable_validation
+            else None
+        )
+        cloudsc = cloudsc_cls(
+            computational_grid,
+            yoecldp_paramaters,
+            yoethf_parameters,
+            yomcst_parameters,
+            yrecldp_parameters,
+            enable_checks=config.sympl_enable_checks,
+            gt4py_config=config.gt4py_config,
+        )
+        tends, diags = cloudsc(state, dt)
 
-    config.gt4py_config.reset_exec_info()
+    # the stencils record their execution info only if required, to keep it off the timed runs
+    if collect_exec_info:
+        config.gt4py_config.reset_exec_info()
 
     runtime_l = []
     for i in range(config.num_runs):
@@ -97,14 +169,8 @@ def core(config: PythonConfig, io_config: IOConfig, cloudsc_cls: Type) -> None:
             mflops_stddev,
         )
 
-    if config.enable_validation:
-        hdf5_reader_ref = HDF5Reader(config.reference_file, config.data_types)
-        tends_ref = get_reference_tendencies(
-            computational_grid, hdf5_reader_ref, gt4py_config=config.gt4py_config
-        )
-        diags_ref = get_reference_diagnostics(
-            computational_grid, hdf5_reader_ref, gt4py_config=config.gt4py_config
-        )
+    if future_ref is not None:
+        tends_ref, diags_ref = future_ref.result()
         print("\n== Validation:")
         validate(tends, tends_ref, atol=config.atol, rtol=config.rtol)
         validate(diags, diags_ref, atol=config.atol, rtol=config.rtol)
@@ -132,6 +198,14 @@ def core(config: PythonConfig, io_config: IOConfig, cloudsc_cls: Type) -> None:
     default=True,
     help="Enable/disable data validation (default: enabled).",
 )
+@click.option(
+    "--fast-math/--no-fast-math",
+    is_flag=True,
+    type=bool,
+    default=False,
+    help="Enable/disable unsafe floating-point optimizations and native instruction sets when "
+    "compiling the stencils with any backend but numpy (default: disabled).",
+)
 @click.option("--num-cols", type=int, default=1, help="Number of domain columns (default: 1).")
 @click.option("--num-runs", type=int, default=1, help="Number of executions (default: 1).")
 @click.option(
@@ -165,6 +239,7 @@ def main(
     backend: str,
     enable_checks: bool,
     enable_validation: bool,
+    fast_math: bool,
     num_cols: int,
     num_runs: int,
     precision: Literal["double", "single"],
@@ -175,6 +250,11 @@ def main(
     atol: Optional[float],
     rtol: Optional[float],
 ) -> None:
+    if os.environ.get("CLOUDSC_PERSIST_CACHE", "0") == "1":
+        enable_persistent_cache()
+    if fast_math:
+        enable_fast_math(backend)
+
     config = (
         DEFAULT_CONFIG.with_precision(precision)
         .with_backend(backend)
@@ -185,7 +265,12 @@ def main(
     )
     io_config = DEFAULT_IO_CONFIG.with_output_csv_file(output_csv_file).with_host_name(host_alias)
     cloudsc_cls = CloudscSplit if variant == "split" else Cloudsc
-    core(config, io_config, cloudsc_cls=cloudsc_cls)
+    core(
+        config,
+        io_config,
+        cloudsc_cls=cloudsc_cls,
+        collect_exec_info=output_csv_file_stencils is not None,
+    )
 
     if output_csv_file_stencils is not None:
         write_stencils_performance_to_csv(
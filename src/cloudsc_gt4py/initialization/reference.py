@@ -19,7 +19,7 @@ from datetime import datetime
 from functools import partial
 from typing import TYPE_CHECKING
 
-from cloudsc_gt4py.initialization.utils import initialize_field
+from cloudsc_gt4py.initialization.utils import initialize_fields
 from ifs_physics_common.framework.grid import I, J, K
 from ifs_physics_common.framework.storage import allocate_data_array
 
@@ -32,6 +32,13 @@ if TYPE_CHECKING:
     from ifs_physics_common.utils.typingx import DataArray, DataArrayDict
 
 
+TENDENCY_HDF5_READER_KEYS = {
+    "f_a": "TENDENCY_LOC_A",
+    "f_qv": "TENDENCY_LOC_Q",
+    "f_t": "TENDENCY_LOC_T",
+}
+
+
 def allocate_tendencies(
     computational_grid: ComputationalGrid, *, gt4py_config: GT4PyConfig
 ) -> DataArrayDict:
@@ -53,14 +60,13 @@ def allocate_tendencies(
 
 
 def initialize_tendencies(tendencies: DataArrayDict, hdf5_reader: HDF5Reader) -> None:
-    hdf5_reader_keys = {"f_a": "TENDENCY_LOC_A", "f_qv": "TENDENCY_LOC_Q", "f_t": "TENDENCY_LOC_T"}
-    for name, hdf5_reader_key in hdf5_reader_keys.items():
-        buffer = hdf5_reader.get_field(hdf5_reader_key)
-        initialize_field(tendencies[name], buffer)
-
-    cld = hdf5_reader.get_field("TENDENCY_LOC_CLD")
+    dtypes = {key: tendencies[name].dtype for name, key in TENDENCY_HDF5_READER_KEYS.items()}
+    dtypes["TENDENCY_LOC_CLD"] = tendencies["f_ql"].dtype
+    hdf5_buffers = hdf5_reader.get_fields(dtypes)
+    buffers = {name: hdf5_buffers[key] for name, key in TENDENCY_HDF5_READER_KEYS.items()}
     for idx, name in enumerate(("f_ql", "f_qi", "f_qr", "f_qs")):
-        initialize_field(tendencies[name], cld[..., idx])
+        buffers[name] = hdf5_buffers["TENDENCY_LOC_CLD"][..., idx]
+    initialize_fields(tendencies, buffers)
 
 
 def allocate_diagnostics(
@@ -100,9 +106,11 @@ def allocate_diagnostics(
 
 def initialize_diagnostics(diagnostics: DataArrayDict, hdf5_reader: HDF5Reader) -> None:
     hdf5_reader_keys = {name: "P" + name[2:].upper() for name in diagnostics if name != "time"}
-    for name, hdf5_reader_key in hdf5_reader_keys.items():
-        buffer = hdf5_reader.get_field(hdf5_reader_key)
-        initialize_field(diagnostics[name], buffer)
+    dtypes = {key: diagnostics[name].dtype for name, key in hdf5_reader_keys.items()}
+    hdf5_buffers = hdf5_reader.get_fields(dtypes)
+    initialize_fields(
+        diagnostics, {name: hdf5_buffers[key] for name, key in hdf5_reader_keys.items()}
+    )
 
 
 def get_reference_tendencies(
@@ -19,7 +19,7 @@ from datetime import datetime
 from functools import partial
 from typing import TYPE_CHECKING
 
-from cloudsc_gt4py.initialization.utils import initialize_field
+from cloudsc_gt4py.initialization.utils import initialize_fields
 from ifs_physics_common.framework.grid import I, J, K
 from ifs_physics_common.framework.storage import allocate_data_array
 
@@ -32,6 +32,40 @@ if TYPE_CHECKING:
     from ifs_physics_common.utils.typingx import DataArray, DataArrayDict
 
 
+STATE_HDF5_READER_KEYS = {
+    "b_convection_on": "LDCUM",
+    "f_a": "PA",
+    "f_ap": "PAP",
+    "f_aph": "PAPH",
+    "f_ccn": "PCCN",
+    "f_dyni": "PDYNI",
+    "f_dynl": "PDYNL",
+    "f_hrlw": "PHRLW",
+    "f_hrsw": "PHRSW",
+    "f_icrit_aer": "PICRIT_AER",
+    "f_lcrit_aer": "PLCRIT_AER",
+    "f_lsm": "PLSM",
+    "f_lu": "PLU",
+    "f_lude": "PLUDE",
+    "f_mfd": "PMFD",
+    "f_mfu": "PMFU",
+    "f_nice": "PNICE",
+    "f_qv": "PQ",
+    "f_re_ice": "PRE_ICE",
+    "f_snde": "PSNDE",
+    "f_supsat": "PSUPSAT",
+    "f_t": "PT",
+    "f_tnd_tmp_a": "TENDENCY_TMP_A",
+    "f_tnd_tmp_qv": "TENDENCY_TMP_Q",
+    "f_tnd_tmp_t": "TENDENCY_TMP_T",
+    "f_vfa": "PVFA",
+    "f_vfi": "PVFI",
+    "f_vfl": "PVFL",
+    "f_w": "PVERVEL",
+    "i_convection_type": "KTYPE",
+}
+
+
 def allocate_state(
     computational_grid: ComputationalGrid, *, gt4py_config: GT4PyConfig
 ) -> DataArrayDict:
@@ -92,49 +126,16 @@ def allocate_state(
 
 
 def initialize_state(state: DataArrayDict, hdf5_reader: HDF5Reader) -> None:
-    hdf5_reader_keys = {
-        "b_convection_on": "LDCUM",
-        "f_a": "PA",
-        "f_ap": "PAP",
-        "f_aph": "PAPH",
-        "f_ccn": "PCCN",
-        "f_dyni": "PDYNI",
-        "f_dynl": "PDYNL",
-        "f_hrlw": "PHRLW",
-        "f_hrsw": "PHRSW",
-        "f_icrit_aer": "PICRIT_AER",
-        "f_lcrit_aer": "PLCRIT_AER",
-        "f_lsm": "PLSM",
-        "f_lu": "PLU",
-        "f_lude": "PLUDE",
-        "f_mfd": "PMFD",
-        "f_mfu": "PMFU",
-        "f_nice": "PNICE",
-        "f_qv": "PQ",
-        "f_re_ice": "PRE_ICE",
-        "f_snde": "PSNDE",
-        "f_supsat": "PSUPSAT",
-        "f_t": "PT",
-        "f_tnd_tmp_a": "TENDENCY_TMP_A",
-        "f_tnd_tmp_qv": "TENDENCY_TMP_Q",
-        "f_tnd_tmp_t": "TENDENCY_TMP_T",
-        "f_vfa": "PVFA",
-        "f_vfi": "PVFI",
-        "f_vfl": "PVFL",
-        "f_w": "PVERVEL",
-        "i_convection_type": "KTYPE",
-    }
-    for name, hdf5_reader_key in hdf5_reader_keys.items():
-        buffer = hdf5_reader.get_field(hdf5_reader_key)
-        initialize_field(state[name], buffer)
-
-    clv = hdf5_reader.get_field("PCLV")
+    dtypes = {key: state[name].dtype for name, key in STATE_HDF5_READER_KEYS.items()}
+    dtypes["PCLV"] = state["f_ql"].dtype
+    dtypes["TENDENCY_TMP_CLD"] = state["f_tnd_tmp_ql"].dtype
+    hdf5_buffers = hdf5_reader.get_fields(dtypes)
+    buffers = {name: hdf5_buffers[key] for name, key in STATE_HDF5_READER_KEYS.items()}
     for idx, name in enumerate(("f_ql", "f_qi", "f_qr", "f_qs")):
-        initialize_field(state[name], clv[..., idx])
-
-    tnd_tmp_cld = hdf5_reader.get_field("TENDENCY_TMP_CLD")
+        buffers[name] = hdf5_buffers["PCLV"][..., idx]
     for idx, name in enumerate(("f_tnd_tmp_ql", "f_tnd_tmp_qi", "f_tnd_tmp_qr", "f_tnd_tmp_qs")):
-        initialize_field(state[name], tnd_tmp_cld[..., idx])
+        buffers[name] = hdf5_buffers["TENDENCY_TMP_CLD"][..., idx]
+    initialize_fields(state, buffers)
 
 
 def get_state(
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from typing import TYPE_CHECKING
 
@@ -22,27 +23,27 @@ from ifs_physics_common.utils.numpyx import assign
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
+    from typing import Dict, Tuple
 
-    from ifs_physics_common.utils.typingx import DataArray, NDArrayLike
+    from ifs_physics_common.utils.typingx import DataArray, DataArrayDict, NDArrayLike
+
+
+MAX_WORKERS = 8
 
 
 def initialize_storage_2d(storage: NDArrayLike, buffer: NDArray) -> None:
     ni = storage.shape[0]
     mi = buffer.size
-    nb = ni // mi
-    for b in range(nb):
-        assign(storage[b * mi : (b + 1) * mi, 0:1], buffer[:, np.newaxis])
-    assign(storage[nb * mi :, 0:1], buffer[: ni - nb * mi, np.newaxis])
+    # replicate the buffer cyclically along the first axis, and copy it in one go
+    assign(storage[:, 0:1], buffer[np.arange(ni) % mi, np.newaxis])
 
 
 def initialize_storage_3d(storage: NDArrayLike, buffer: NDArray) -> None:
     ni, _, nk = storage.shape
     mi, mk = buffer.shape
     lk = min(nk, mk)
-    nb = ni // mi
-    for b in range(nb):
-        assign(storage[b * mi : (b + 1) * mi, 0:1, :lk], buffer[:, np.newaxis, :lk])
-    assign(storage[nb * mi :, 0:1, :lk], buffer[: ni - nb * mi, np.newaxis, :lk])
+    # replicate the buffer cyclically along the first axis, and copy it in one go
+    assign(storage[:, 0:1, :lk], buffer[np.arange(ni) % mi, np.newaxis, :lk])
 
 
 def initialize_field(field: DataArray, buffer: NDArray) -> None:
@@ -52,3 +53,13 @@ def initialize_field(field: DataArray, buffer: NDArray) -> None:
         initialize_storage_3d(field.data, buffer)
     else:
         raise ValueError("The field to initialize must be either 2-d or 3-d.")
+
+
+def initialize_fields(fields: DataArrayDict, buffers: Dict[str, NDArray]) -> None:
+    def initialize(item: Tuple[str, NDArray]) -> None:
+        name, buffer = item
+        initialize_field(fields[name], buffer)
+
+    # the copies into the fields release the GIL and overlap
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(buffers))) as executor:
+        list(executor.map(initialize, buffers.items()))
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022-2024 ETH Zurich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from contextlib import ExitStack
+from functools import cached_property
+from itertools import repeat
+import numpy as np
+from typing import TYPE_CHECKING
+
+from ifs_physics_common.framework.components import ImplicitTendencyComponent
+from ifs_physics_common.framework.grid import I, J, K
+from ifs_physics_common.framework.storage import managed_temporary_storage
+from ifs_physics_common.utils.numpyx import assign
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+    from typing import Dict, List, Optional, Tuple
+
+    from ifs_physics_common.framework.config import GT4PyConfig
+    from ifs_physics_common.framework.grid import ComputationalGrid, DimSymbol
+    from ifs_physics_common.utils.typingx import NDArrayLike
+
+
+class CloudscComponent(ImplicitTendencyComponent):
+    """Setup shared by the components wrapping the CLOUDSC stencils."""
+
+    def __init__(
+        self,
+        computational_grid: ComputationalGrid,
+        *,
+        enable_checks: bool = True,
+        gt4py_config: GT4PyConfig,
+    ) -> None:
+        # create the stack first, so that __del__ can close it even if the construction fails
+        self._temporaries_stack = ExitStack()
+        super().__init__(computational_grid, enable_checks=enable_checks, gt4py_config=gt4py_config)
+        self.nlev = self.computational_grid.grids[I, J, K].shape[2]
+        self._timestep: Optional[timedelta] = None
+        self._dt = self.gt4py_config.dtypes.float(0.0)
+
+    def __del__(self) -> None:
+        self._temporaries_stack.close()
+
+    @cached_property
+    def input_arg_names(self) -> Dict[str, str]:
+        return {name: "in_" + name.split("_", maxsplit=1)[1] for name in self.input_properties}
+
+    @cached_property
+    def tendency_arg_names(self) -> Dict[str, str]:
+        return {
+            name: "out_tnd_loc_" + name.split("_", maxsplit=1)[1]
+            for name in self.tendency_properties
+        }
+
+    @cached_property
+    def diagnostic_arg_names(self) -> Dict[str, str]:
+        return {
+            name: "out_" + name.split("_", maxsplit=1)[1] for name in self.diagnostic_properties
+        }
+
+    def allocate_temporaries(
+        self, *extra_specs: Tuple[Tuple[DimSymbol, ...], str]
+    ) -> List[NDArrayLike]:
+        """Allocate the temporaries for the lifetime of the component.
+
+        The temporaries common to all stencils are stored in ``self.temporaries``;
+        the fields described by ``extra_specs`` are returned.
+        """
+        (
+            aph_s,
+            cldtopdist,
+            covpmax,
+            covptot,
+            paphd,
+            trpaus,
+            rainliq,
+            klevel,
+            *extras,
+        ) = self._temporaries_stack.enter_context(
+            managed_temporary_storage(
+                self.computational_grid,
+                *repeat(((I, J), "float"), 6),
+                ((I, J), "bool"),
+                ((K,), "int"),
+                *extra_specs,
+                gt4py_config=self.gt4py_config,
+            )
+        )
+        self.temporaries = {
+            "tmp_aph_s": aph_s,
+            "tmp_cldtopdist": cldtopdist,
+            "tmp_covpmax": covpmax,
+            "tmp_covptot": covptot,
+            "tmp_klevel": klevel,
+            "tmp_paphd": paphd,
+            "tmp_rainliq": rainliq,
+            "tmp_trpaus": trpaus,
+        }
+        assign(klevel, np.arange(self.nlev + 1, dtype=klevel.dtype))
+        return extras
+
+    def get_dt(self, timestep: timedelta) -> float:
+        if timestep != self._timestep:
+            self._timestep = timestep
+            self._dt = self.gt4py_config.dtypes.float(timestep.total_seconds())
+        return self._dt
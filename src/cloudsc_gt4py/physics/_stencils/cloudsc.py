@@ -218,6 +218,10 @@ def cloudsc(
         WARMRAIN,
     )
 
+    with computation(BACKWARD), interval(-1, None):
+        # surface pressure
+        tmp_aph_s[0, 0] = in_aph[0, 0, 0]
+
     with computation(FORWARD), interval(0, 1):
         # zero arrays
         out_rainfrac_toprfz[0, 0] = 0.0
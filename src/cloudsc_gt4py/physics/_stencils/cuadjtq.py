@@ -16,7 +16,7 @@
 
 from gt4py.cartesian import gtscript
 
-from cloudsc_gt4py.physics._stencils.fcttre import f_foedem, f_foeewm, f_foeldcpm
+from cloudsc_gt4py.physics._stencils.fcttre import f_foe_bundle
 from ifs_physics_common.framework.stencil import function_collection
 
 
@@ -25,11 +25,12 @@ from ifs_physics_common.framework.stencil import function_collection
 def f_cuadjtq_5(qp, qsmix, t):
     from __externals__ import RETV
 
-    qsat = min(f_foeewm(t) * qp, 0.5)
+    foeewm, foedem, foeldcpm = f_foe_bundle(t)
+    qsat = min(foeewm * qp, 0.5)
     cor = 1.0 / (1.0 - RETV * qsat)
     qsat *= cor
-    cond = (qsmix - qsat) / (1.0 + qsat * cor * f_foedem(t))
-    t += f_foeldcpm(t) * cond
+    cond = (qsmix - qsat) / (1.0 + qsat * cor * foedem)
+    t += foeldcpm * cond
     qsmix -= cond
     return qsmix, t
 
@@ -30,38 +30,83 @@ def f_foedelta(t):
 @function_collection("f_foealfa")
 @gtscript.function
 def f_foealfa(t):
-    from __externals__ import RTICE, RTWAT, RTWAT_RTICE_R
+    from __externals__ import RTICE, RTWAT_RTICE_R
 
-    return min(1.0, ((max(RTICE, min(RTWAT, t)) - RTICE) * RTWAT_RTICE_R) ** 2.0)
+    x = min(1.0, max(0.0, (t - RTICE) * RTWAT_RTICE_R))
+    return x * x
+
+
+# the functions below take alfa = f_foealfa(t), dl = t - R4LES and di = t - R4IES precomputed,
+# so that these can be shared by the callers
+
+
+@function_collection("f_foeewm_alfa")
+@gtscript.function
+def f_foeewm_alfa(t, alfa, dl, di):
+    from __externals__ import R2ES, R3IES, R3LES, RTT
+
+    tc = t - RTT
+    return R2ES * (alfa * exp(R3LES * tc / dl) + (1.0 - alfa) * (exp(R3IES * tc / di)))
+
+
+@function_collection("f_foedem_alfa")
+@gtscript.function
+def f_foedem_alfa(alfa, dl, di):
+    from __externals__ import R5ALSCP, R5ALVCP
+
+    return alfa * R5ALVCP * (1.0 / dl**2.0) + (1.0 - alfa) * R5ALSCP * (1.0 / di**2.0)
+
+
+@function_collection("f_foeldcpm_alfa")
+@gtscript.function
+def f_foeldcpm_alfa(alfa):
+    from __externals__ import RALSDCP, RALVDCP
+
+    return alfa * RALVDCP + (1.0 - alfa) * RALSDCP
 
 
 @function_collection("f_foeewm")
 @gtscript.function
 def f_foeewm(t):
-    from __externals__ import R2ES, R3IES, R3LES, R4IES, R4LES, RTT
+    from __externals__ import R4IES, R4LES
 
-    return R2ES * (
-        f_foealfa(t) * exp(R3LES * (t - RTT) / (t - R4LES))
-        + (1.0 - f_foealfa(t)) * (exp(R3IES * (t - RTT) / (t - R4IES)))
-    )
+    alfa = f_foealfa(t)
+    dl = t - R4LES
+    di = t - R4IES
+    return f_foeewm_alfa(t, alfa, dl, di)
 
 
 @function_collection("f_foedem")
 @gtscript.function
 def f_foedem(t):
-    from __externals__ import R4IES, R4LES, R5ALSCP, R5ALVCP
+    from __externals__ import R4IES, R4LES
 
-    return f_foealfa(t) * R5ALVCP * (1.0 / (t - R4LES) ** 2.0) + (1.0 - f_foealfa(t)) * R5ALSCP * (
-        1.0 / (t - R4IES) ** 2.0
-    )
+    alfa = f_foealfa(t)
+    dl = t - R4LES
+    di = t - R4IES
+    return f_foedem_alfa(alfa, dl, di)
 
 
 @function_collection("f_foeldcpm")
 @gtscript.function
 def f_foeldcpm(t):
-    from __externals__ import RALSDCP, RALVDCP
+    alfa = f_foealfa(t)
+    return f_foeldcpm_alfa(alfa)
 
-    return f_foealfa(t) * RALVDCP + (1.0 - f_foealfa(t)) * RALSDCP
+
+@function_collection("f_foe_bundle")
+@gtscript.function
+def f_foe_bundle(t):
+    from __externals__ import R4IES, R4LES
+
+    # f_foeewm, f_foedem and f_foeldcpm sharing alfa and the denominators
+    alfa = f_foealfa(t)
+    dl = t - R4LES
+    di = t - R4IES
+    foeewm = f_foeewm_alfa(t, alfa, dl, di)
+    foedem = f_foedem_alfa(alfa, dl, di)
+    foeldcpm = f_foeldcpm_alfa(alfa)
+    return foeewm, foedem, foeldcpm
 
 
 @function_collection("f_foeeliq")
@@ -16,15 +16,11 @@
 
 from __future__ import annotations
 from functools import cached_property
-from itertools import repeat
-import numpy as np
 import sys
 from typing import TYPE_CHECKING
 
-from ifs_physics_common.framework.components import ImplicitTendencyComponent
+from cloudsc_gt4py.physics._base import CloudscComponent
 from ifs_physics_common.framework.grid import I, J, K
-from ifs_physics_common.framework.storage import managed_temporary_storage
-from ifs_physics_common.utils.numpyx import assign
 
 if TYPE_CHECKING:
     from datetime import timedelta
@@ -41,7 +37,7 @@ if TYPE_CHECKING:
     from ifs_physics_common.utils.typingx import NDArrayLikeDict, PropertyDict
 
 
-class Cloudsc(ImplicitTendencyComponent):
+class Cloudsc(CloudscComponent):
     def __init__(
         self,
         computational_grid: ComputationalGrid,
@@ -55,7 +51,8 @@ class Cloudsc(ImplicitTendencyComponent):
     ) -> None:
         super().__init__(computational_grid, enable_checks=enable_checks, gt4py_config=gt4py_config)
 
-        self.nlev = self.computational_grid.grids[I, J, K].shape[2]
+        # the launch domain does not change across calls: compute it once
+        self.domain = self.computational_grid.grids[I, J, K - 1 / 2].shape
         externals = {}
         externals.update(yoecldp_parameters.dict())
         externals.update(yoethf_parameters.dict())
@@ -102,6 +99,8 @@ class Cloudsc(ImplicitTendencyComponent):
 
         self.cloudsc = self.compile_stencil("cloudsc", externals)
 
+        self.allocate_temporaries()
+
     @cached_property
     def _input_properties(self) -> PropertyDict:
         # todo(stubbiali): sort out units
@@ -186,45 +185,22 @@ class Cloudsc(ImplicitTendencyComponent):
         out_diagnostics: NDArrayLikeDict,
         overwrite_tendencies: Dict[str, bool],
     ) -> None:
-        with managed_temporary_storage(
-            self.computational_grid,
-            *repeat(((I, J), "float"), 6),
-            ((I, J), "bool"),
-            ((K,), "int"),
-            gt4py_config=self.gt4py_config,
-        ) as (aph_s, cldtopdist, covpmax, covptot, paphd, trpaus, rainliq, klevel):
-            inputs = {
-                "in_" + name.split("_", maxsplit=1)[1]: state[name]
-                for name in self.input_properties
-            }
-            tendencies = {
-                "out_tnd_loc_" + name.split("_", maxsplit=1)[1]: out_tendencies[name]
-                for name in self.tendency_properties
-            }
-            diagnostics = {
-                "out_" + name.split("_", maxsplit=1)[1]: out_diagnostics[name]
-                for name in self.diagnostic_properties
-            }
-            temporaries = {
-                "tmp_aph_s": aph_s,
-                "tmp_cldtopdist": cldtopdist,
-                "tmp_covpmax": covpmax,
-                "tmp_covptot": covptot,
-                "tmp_klevel": klevel,
-                "tmp_paphd": paphd,
-                "tmp_rainliq": rainliq,
-                "tmp_trpaus": trpaus,
-            }
-            aph_s[...] = state["f_aph"][..., self.nlev]
-            assign(klevel, np.arange(self.nlev + 1))
-            self.cloudsc(
-                **inputs,
-                **tendencies,
-                **diagnostics,
-                **temporaries,
-                dt=self.gt4py_config.dtypes.float(timestep.total_seconds()),
-                origin=(0, 0, 0),
-                domain=self.computational_grid.grids[I, J, K - 1 / 2].shape,
-                validate_args=self.gt4py_config.validate_args,
-                exec_info=self.gt4py_config.exec_info,
-            )
+        inputs = {arg_name: state[name] for name, arg_name in self.input_arg_names.items()}
+        tendencies = {
+            arg_name: out_tendencies[name] for name, arg_name in self.tendency_arg_names.items()
+        }
+        diagnostics = {
+            arg_name: out_diagnostics[name] for name, arg_name in self.diagnostic_arg_names.items()
+        }
+        dt = self.get_dt(timestep)
+        self.cloudsc(
+            **inputs,
+            **tendencies,
+            **diagnostics,
+            **self.temporaries,
+            dt=dt,
+            origin=(0, 0, 0),
+            domain=self.domain,
+            validate_args=self.gt4py_config.validate_args,
+            exec_info=self.gt4py_config.exec_info,
+        )
@@ -17,14 +17,11 @@
 from __future__ import annotations
 from functools import cached_property
 from itertools import repeat
-import numpy as np
 import sys
 from typing import TYPE_CHECKING
 
-from ifs_physics_common.framework.components import ImplicitTendencyComponent
+from cloudsc_gt4py.physics._base import CloudscComponent
 from ifs_physics_common.framework.grid import I, J, K
-from ifs_physics_common.framework.storage import managed_temporary_storage
-from ifs_physics_common.utils.numpyx import assign
 
 if TYPE_CHECKING:
     from datetime import timedelta
@@ -41,7 +38,29 @@ if TYPE_CHECKING:
     from ifs_physics_common.utils.typingx import NDArrayLikeDict, PropertyDict
 
 
-class CloudscSplit(ImplicitTendencyComponent):
+INTERMEDIATE_NAMES = (
+    "foealfa",
+    "lneg_qi",
+    "lneg_ql",
+    "lneg_qr",
+    "lneg_qs",
+    "lude",
+    "pfplsi",
+    "pfplsl",
+    "pfplsr",
+    "pfplss",
+    "qi0",
+    "qin",
+    "ql0",
+    "qln",
+    "qr0",
+    "qrn",
+    "qs0",
+    "qsn",
+)
+
+
+class CloudscSplit(CloudscComponent):
     def __init__(
         self,
         computational_grid: ComputationalGrid,
@@ -55,7 +74,8 @@ class CloudscSplit(ImplicitTendencyComponent):
     ) -> None:
         super().__init__(computational_grid, enable_checks=enable_checks, gt4py_config=gt4py_config)
 
-        self.nlev = self.computational_grid.grids[I, J, K].shape[2]
+        self.domain_tendencies = self.computational_grid.grids[I, J, K].shape
+        self.domain_fluxes = self.computational_grid.grids[I, J, K - 1 / 2].shape
         externals = {}
         externals.update(yoecldp_parameters.dict())
         externals.update(yoethf_parameters.dict())
@@ -103,6 +123,17 @@ class CloudscSplit(ImplicitTendencyComponent):
         self.cloudsc_tendencies = self.compile_stencil("cloudsc_tendencies", externals)
         self.cloudsc_fluxes = self.compile_stencil("cloudsc_fluxes", externals)
 
+        intermediates = self.allocate_temporaries(
+            *repeat(((I, J, K), "float"), len(INTERMEDIATE_NAMES))
+        )
+        # fields computed by cloudsc_tendencies and consumed by cloudsc_fluxes
+        self.intermediate_outputs = {
+            "out_" + name: field for name, field in zip(INTERMEDIATE_NAMES, intermediates)
+        }
+        self.intermediate_inputs = {
+            "in_" + name: field for name, field in zip(INTERMEDIATE_NAMES, intermediates)
+        }
+
     @cached_property
     def _input_properties(self) -> PropertyDict:
         # todo(stubbiali): sort out units
@@ -187,135 +218,50 @@ class CloudscSplit(ImplicitTendencyComponent):
         out_diagnostics: NDArrayLikeDict,
         overwrite_tendencies: Dict[str, bool],
     ) -> None:
-        with managed_temporary_storage(
-            self.computational_grid,
-            *repeat(((I, J), "float"), 6),
-            ((I, J), "bool"),
-            ((K,), "int"),
-            *repeat(((I, J, K), "float"), 18),
-            gt4py_config=self.gt4py_config,
-        ) as (
-            aph_s,
-            cldtopdist,
-            covpmax,
-            covptot,
-            paphd,
-            trpaus,
-            rainliq,
-            klevel,
-            foealfa,
-            lneg_qi,
-            lneg_ql,
-            lneg_qr,
-            lneg_qs,
-            lude,
-            pfplsi,
-            pfplsl,
-            pfplsr,
-            pfplss,
-            qi0,
-            qin,
-            ql0,
-            qln,
-            qr0,
-            qrn,
-            qs0,
-            qsn,
-        ):
-            inputs = {
-                "in_" + name.split("_", maxsplit=1)[1]: state[name]
-                for name in self.input_properties
-            }
-            tendencies = {
-                "out_tnd_loc_" + name.split("_", maxsplit=1)[1]: out_tendencies[name]
-                for name in self.tendency_properties
-            }
-            diagnostics = {
-                "out_" + name.split("_", maxsplit=1)[1]: out_diagnostics[name]
-                for name in self.diagnostic_properties
-            }
-            temporaries = {
-                "tmp_aph_s": aph_s,
-                "tmp_cldtopdist": cldtopdist,
-                "tmp_covpmax": covpmax,
-                "tmp_covptot": covptot,
-                "tmp_klevel": klevel,
-                "tmp_paphd": paphd,
-                "tmp_rainliq": rainliq,
-                "tmp_trpaus": trpaus,
-            }
-            aph_s[...] = state["f_aph"][..., self.nlev]
-            assign(klevel, np.arange(self.nlev + 1))
+        inputs = {arg_name: state[name] for name, arg_name in self.input_arg_names.items()}
+        tendencies = {
+            arg_name: out_tendencies[name] for name, arg_name in self.tendency_arg_names.items()
+        }
+        diagnostics = {
+            arg_name: out_diagnostics[name] for name, arg_name in self.diagnostic_arg_names.items()
+        }
+        dt = self.get_dt(timestep)
 
-            inputs1 = inputs.copy()
-            vfi = inputs1.pop("in_vfi")
-            vfl = inputs1.pop("in_vfl")
-            diagnostics1 = {
-                "out_covptot": diagnostics["out_covptot"],
-                "out_foealfa": foealfa,
-                "out_lneg_qi": lneg_qi,
-                "out_lneg_ql": lneg_ql,
-                "out_lneg_qr": lneg_qr,
-                "out_lneg_qs": lneg_qs,
-                "out_lude": lude,
-                "out_pfplsi": pfplsi,
-                "out_pfplsl": pfplsl,
-                "out_pfplsr": pfplsr,
-                "out_pfplss": pfplss,
-                "out_qi0": qi0,
-                "out_qin": qin,
-                "out_ql0": ql0,
-                "out_qln": qln,
-                "out_qr0": qr0,
-                "out_qrn": qrn,
-                "out_qs0": qs0,
-                "out_qsn": qsn,
-                "out_rainfrac_toprfz": diagnostics["out_rainfrac_toprfz"],
-            }
-            self.cloudsc_tendencies(
-                **inputs1,
-                **tendencies,
-                **diagnostics1,
-                **temporaries,
-                dt=timestep.total_seconds(),
-                origin=(0, 0, 0),
-                domain=self.computational_grid.grids[I, J, K].shape,
-                validate_args=self.gt4py_config.validate_args,
-                exec_info=self.gt4py_config.exec_info,
-            )
+        inputs1 = inputs.copy()
+        vfi = inputs1.pop("in_vfi")
+        vfl = inputs1.pop("in_vfl")
+        diagnostics1 = {
+            "out_covptot": diagnostics["out_covptot"],
+            "out_rainfrac_toprfz": diagnostics["out_rainfrac_toprfz"],
+            **self.intermediate_outputs,
+        }
+        self.cloudsc_tendencies(
+            **inputs1,
+            **tendencies,
+            **diagnostics1,
+            **self.temporaries,
+            dt=dt,
+            origin=(0, 0, 0),
+            domain=self.domain_tendencies,
+            validate_args=self.gt4py_config.validate_args,
+            exec_info=self.gt4py_config.exec_info,
+        )
 
-            inputs2 = {
-                "in_aph": inputs["in_aph"],
-                "in_foealfa": foealfa,
-                "in_lneg_qi": lneg_qi,
-                "in_lneg_ql": lneg_ql,
-                "in_lneg_qr": lneg_qr,
-                "in_lneg_qs": lneg_qs,
-                "in_lude": lude,
-                "in_pfplsi": pfplsi,
-                "in_pfplsl": pfplsl,
-                "in_pfplsr": pfplsr,
-                "in_pfplss": pfplss,
-                "in_qi0": qi0,
-                "in_qin": qin,
-                "in_ql0": ql0,
-                "in_qln": qln,
-                "in_qr0": qr0,
-                "in_qrn": qrn,
-                "in_qs0": qs0,
-                "in_qsn": qsn,
-                "in_vfi": vfi,
-                "in_vfl": vfl,
-            }
-            outputs2 = diagnostics.copy()
-            outputs2.pop("out_covptot")
-            outputs2.pop("out_rainfrac_toprfz")
-            self.cloudsc_fluxes(
-                **inputs2,
-                **outputs2,
-                dt=timestep.total_seconds(),
-                origin=(0, 0, 0),
-                domain=self.computational_grid.grids[I, J, K - 1 / 2].shape,
-                validate_args=self.gt4py_config.validate_args,
-                exec_info=self.gt4py_config.exec_info,
-            )
+        inputs2 = {
+            "in_aph": inputs["in_aph"],
+            "in_vfi": vfi,
+            "in_vfl": vfl,
+            **self.intermediate_inputs,
+        }
+        outputs2 = diagnostics.copy()
+        outputs2.pop("out_covptot")
+        outputs2.pop("out_rainfrac_toprfz")
+        self.cloudsc_fluxes(
+            **inputs2,
+            **outputs2,
+            dt=dt,
+            origin=(0, 0, 0),
+            domain=self.domain_fluxes,
+            validate_args=self.gt4py_config.validate_args,
+            exec_info=self.gt4py_config.exec_info,
+        )
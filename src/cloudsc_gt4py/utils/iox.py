@@ -24,7 +24,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from numpy.typing import NDArray
+    from numpy.typing import DTypeLike, NDArray
     from typing import Dict, Optional, Type, Union
 
     from ifs_physics_common.framework.config import DataTypes
@@ -203,26 +203,35 @@ class HDF5Reader:
     data_types: DataTypes
 
     def __init__(self, filename: str, data_types: DataTypes) -> None:
-        self.f = h5py.File(filename)
+        # load the whole file into memory with a single sequential read, so that the many
+        # small dataset reads which follow do not hit the disk
+        self.f = h5py.File(filename, "r", driver="core")
         self.data_types = data_types
 
     def __del__(self) -> None:
         self.f.close()
 
-    def get_field(self, name: str) -> NDArray:
+    def get_field(self, name: str, dtype: Optional[DTypeLike] = None) -> NDArray:
         ds = self.f.get(name, None)
         if ds is None:
             raise RuntimeError(f"Unknown field `{name}`.")
 
         if ds.ndim == 1:
-            return self._get_field_1d(ds, name)
+            field = self._get_field_1d(ds, name)
         elif ds.ndim == 2:
-            return self._get_field_2d(ds, name)
+            field = self._get_field_2d(ds, name)
         elif ds.ndim == 3:
-            return self._get_field_3d(ds, name)
+            field = self._get_field_3d(ds, name)
         else:
             raise RuntimeError(f"The field `{name}` has unexpected shape {ds.shape}.")
 
+        # cast on the host, so that no wider-than-needed buffer is transferred to the storage
+        # (no copy is made if the dtype already matches)
+        return field if dtype is None else field.astype(dtype, copy=False)
+
+    def get_fields(self, dtypes: Dict[str, Optional[DTypeLike]]) -> Dict[str, NDArray]:
+        return {name: self.get_field(name, dtype) for name, dtype in dtypes.items()}
+
     @lru_cache
     def get_nlev(self) -> int:
         return self.f["KLEV"][0]  # type: ignore[no-any-return]